@@ -1,6 +1,6 @@
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RepoData(BaseModel):
@@ -16,9 +16,25 @@ class RepoData(BaseModel):
         archived: Is the repository archived
     """
 
+    # Cached lists are shared between tool calls, so instances must not change
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     name: str
     description: str | None
     url: str
     visibility: Literal["public"] | Literal["private"]
     fork: bool
     archived: bool
+
+
+class RepoRef(BaseModel):
+    """
+    Identifies a repository on GitHub.
+
+    Attributes:
+        owner: The GitHub username or organization name that owns the repository.
+        name: The repository name.
+    """
+
+    owner: str
+    name: str
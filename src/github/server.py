@@ -5,20 +5,271 @@ includes tools for managing GitHub repositories
 
 Model Context Protocol Python SDK Docs https://github.com/modelcontextprotocol/python-sdk
 GitHub API Docs https://docs.github.com/en/rest/repos/repos
+GitHub GraphQL API Docs https://docs.github.com/en/graphql/reference/objects#repository
 """
 
-from typing import List
-import json
+from contextlib import asynccontextmanager
+from heapq import merge
+from operator import itemgetter
+from typing import AsyncIterator, List
+import asyncio
+import time
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.session import ServerSession
+from mcp.types import LoggingLevel
+import anyio
+import httpx
+import orjson
+
+from models import RepoData, RepoRef
+from util import (
+    JSON_CONTENT_HEADERS,
+    github_client,
+    graphql_request,
+    make_github_request,
+)
+
 
-from models import RepoData
-from util import make_github_request
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Keep one GitHub API client open for the lifetime of the server"""
+    async with github_client():
+        yield
 
 
 # Create MCP instance
-mcp = FastMCP(name="GitHub Tools")
+mcp = FastMCP(name="GitHub Tools", lifespan=lifespan)
+
+# Fixed update payloads, encoded once
+PRIVATE_PAYLOAD = orjson.dumps({"visibility": "private"})
+ARCHIVE_PAYLOAD = orjson.dumps({"archived": True})
+UNARCHIVE_PAYLOAD = orjson.dumps({"archived": False})
+
+# Most updates a bulk tool sends to GitHub at once
+BULK_CONCURRENCY = 10
+
+# Whether the client wants info messages, see set_logging_level. A single global
+# works because mcpo runs this server over stdio with one session, it would have to
+# be kept per session before serving SSE or streamable HTTP clients
+_info_enabled = True
+
+
+# FastMCP has no public hook for logging/setLevel, so register it on the low level
+# server it wraps. pyproject.toml pins mcp below 2.0 in case that attribute changes
+@mcp._mcp_server.set_logging_level()
+async def set_logging_level(level: LoggingLevel) -> None:
+    """Records the lowest log level the client asked to receive"""
+    global _info_enabled
+    _info_enabled = level in ("debug", "info")
+
+
+async def log_info(ctx: Context[ServerSession, None], message: str, *args) -> None:
+    """Sends an info message to the client, unless it asked for a higher level.
+
+    Like logging, the message is only formatted with args when it is sent.
+    """
+    if _info_enabled:
+        await ctx.info(message % args if args else message)
+
+
+# Only the fields RepoData needs, for repositories the user owns. GitHub filters
+# forks/archived when asked to
+REPOS_QUERY = """
+query($cursor: String, $isFork: Boolean, $isArchived: Boolean) {
+  viewer {
+    repositories(
+      first: 100
+      after: $cursor
+      isFork: $isFork
+      isArchived: $isArchived
+      ownerAffiliations: [OWNER]
+      orderBy: {field: CREATED_AT, direction: ASC}
+    ) {
+      totalCount
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+      nodes {
+        name
+        description
+        url
+        visibility
+        isFork
+        isArchived
+        createdAt
+      }
+    }
+  }
+}
+"""
+
+# Reads a node's fields in RepoData order with a single call
+REPO_FIELDS = itemgetter(
+    "name", "description", "url", "visibility", "isFork", "isArchived"
+)
+
+# Repository lists by (is_fork, is_archived), reused for REPOS_CACHE_TTL seconds
+REPOS_CACHE_TTL = 60.0
+_repos_cache: dict[tuple[bool | None, bool | None], tuple[float, List[RepoData]]] = {}
+# Downloads currently running, shared by concurrent calls with the same filter
+_repos_inflight: dict[tuple[bool | None, bool | None], asyncio.Task] = {}
+
+
+def get_cached_repos(key: tuple[bool | None, bool | None]) -> List[RepoData] | None:
+    """Gets a repository list cached less than REPOS_CACHE_TTL seconds ago.
+
+    Args:
+        key (tuple[bool | None, bool | None]): The list's (is_fork, is_archived)
+
+    Returns:
+        List[RepoData] | None: The cached list, or None if there is no fresh one
+    """
+    cached = _repos_cache.get(key)
+    if cached and time.monotonic() - cached[0] < REPOS_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def invalidate_repos() -> None:
+    """Forgets cached and in-flight repository lists after a repository changed"""
+    _repos_cache.clear()
+    # Running downloads finish for their callers but are no longer shared or cached
+    _repos_inflight.clear()
+
+
+async def iter_repo_pages(
+    is_fork: bool | None = None, is_archived: bool | None = None
+) -> AsyncIterator[dict]:
+    """Yields each page of one repository listing from GitHub's GraphQL API.
+
+    Args:
+        is_fork (bool | None): Only fetch forks (True) or non-forks (False)
+        is_archived (bool | None): Only fetch archived (True) or active (False)
+
+    Yields:
+        dict: The page's repository connection, with its nodes and totalCount
+    """
+    variables = {"cursor": None, "isFork": is_fork, "isArchived": is_archived}
+    while True:
+        data = await graphql_request(REPOS_QUERY, variables)
+        connection = data["viewer"]["repositories"]
+        yield connection
+        if not connection["pageInfo"]["hasNextPage"]:
+            return
+        variables["cursor"] = connection["pageInfo"]["endCursor"]
+
+
+async def download_repos(
+    ctx: Context[ServerSession, None],
+    is_fork: bool | None = None,
+    is_archived: bool | None = None,
+) -> List[RepoData]:
+    """Downloads the authenticated user's repositories from GitHub.
+
+    Progress is reported to the client as each page arrives.
+
+    Args:
+        ctx (Context[ServerSession, None]): Context for the MCP server session
+        is_fork (bool | None): Only fetch forks (True) or non-forks (False)
+        is_archived (bool | None): Only fetch archived (True) or active (False)
+
+    Returns:
+        List[RepoData]: A list of RepoData objects, oldest first
+    """
+    # Each page's cursor comes from the page before it, so without a fork filter
+    # page through the non-forks and forks side by side
+    listings = [False, True] if is_fork is None else [is_fork]
+    totals: dict[bool, int] = {}
+    fetched = 0
+
+    async def download_nodes(fork: bool) -> List[dict]:
+        nonlocal fetched
+        nodes: List[dict] = []
+        async for page in iter_repo_pages(fork, is_archived):
+            nodes.extend(page["nodes"])
+            fetched += len(page["nodes"])
+            totals[fork] = page["totalCount"]
+            total = sum(totals.values()) if len(totals) == len(listings) else None
+            await ctx.report_progress(fetched, total)
+        return nodes
+
+    pages = await asyncio.gather(*(download_nodes(fork) for fork in listings))
+    # Merge the listings back into creation order
+    nodes = merge(*pages, key=itemgetter("createdAt"))
+    construct = RepoData.model_construct
+    # GitHub's response is trusted, so skip validation
+    repos = [
+        construct(
+            name=name,
+            description=description,
+            url=url,
+            visibility=visibility.lower(),
+            fork=fork,
+            archived=archived,
+        )
+        for name, description, url, visibility, fork, archived in map(
+            REPO_FIELDS, nodes
+        )
+    ]
+
+    await log_info(ctx, "Info: Fetched %s repositories", len(repos))
+    # Only cache the result if no repository changed while it was downloading
+    key = (is_fork, is_archived)
+    if _repos_inflight.get(key) is asyncio.current_task():
+        _repos_cache[key] = (time.monotonic(), repos)
+    return repos
+
+
+async def fetch_repos(
+    ctx: Context[ServerSession, None],
+    is_fork: bool | None = None,
+    is_archived: bool | None = None,
+) -> List[RepoData]:
+    """Fetches the authenticated user's repositories, reusing recent results.
+
+    Calls made while the same download is already running wait for it
+    instead of starting another one.
+
+    Args:
+        ctx (Context[ServerSession, None]): Context for the MCP server session
+        is_fork (bool | None): Only fetch forks (True) or non-forks (False)
+        is_archived (bool | None): Only fetch archived (True) or active (False)
+
+    Returns:
+        List[RepoData]: A list of RepoData objects
+    """
+    key = (is_fork, is_archived)
+    cached = get_cached_repos(key)
+    if cached is not None:
+        await log_info(ctx, "Info: Using cached repositories")
+        return cached
+    # A recent list of every repository can answer any filter without GitHub
+    cached = get_cached_repos((None, None))
+    if cached is not None:
+        await log_info(ctx, "Info: Filtering cached repositories")
+        if is_fork is not None:
+            cached = [repo for repo in cached if repo.fork == is_fork]
+        if is_archived is not None:
+            cached = [repo for repo in cached if repo.archived == is_archived]
+        return cached
+
+    download = _repos_inflight.get(key)
+    if download is None:
+        download = asyncio.create_task(download_repos(ctx, is_fork, is_archived))
+        _repos_inflight[key] = download
+
+        def forget(task: asyncio.Task) -> None:
+            # A newer download may have replaced this one after an update
+            if _repos_inflight.get(key) is task:
+                del _repos_inflight[key]
+
+        download.add_done_callback(forget)
+    else:
+        await log_info(ctx, "Info: Waiting for repositories already being fetched")
+    # Shield the shared download so one caller cancelling doesn't cancel the others
+    return await asyncio.shield(download)
 
 
 @mcp.tool(
@@ -38,37 +289,13 @@ async def get_repos(ctx: Context[ServerSession, None]) -> List[RepoData]:
         ctx (Context[ServerSession, None]): Context for the MCP server session
 
     Returns:
-        List[RepoData]: A list of RepoData objects representing forked repositories
+        List[RepoData]: A list of RepoData objects representing the repositories
 
     Example:
-        repos = await get_forked_repos(ctx)
+        repos = await get_repos(ctx)
     """
-    await ctx.info("Info: Starting processing")
-    params = {
-        "per_page": 100,
-        "sort": "created",
-        "direction": "asc",
-    }
-    url = "user/repos"  # Adjust per_page as needed
-    repos: List[RepoData] = []
-    while url:
-        response = make_github_request(url, params=params)
-        data = response.json()
-        await ctx.info(f"response.request.url: {response.request.url}")
-        for repo in data:
-            repos.append(
-                RepoData(
-                    name=repo.get("name"),
-                    description=repo.get("description"),
-                    url=repo.get("html_url"),
-                    visibility=repo.get("visibility"),
-                    fork=repo.get("fork"),
-                    archived=repo.get("archived"),
-                )
-            )
-        url = response.links.get("next", {}).get("url")  # Get the next page URL
-
-    return repos
+    await log_info(ctx, "Info: Starting processing")
+    return await fetch_repos(ctx)
 
 
 @mcp.tool(
@@ -91,13 +318,14 @@ async def get_archived_repos(ctx: Context[ServerSession, None]) -> List[RepoData
     Example:
         repos = await get_archived_repos(ctx)
     """
-    return [repo for repo in await get_repos(ctx) if repo.archived]
+    await log_info(ctx, "Info: Starting processing")
+    return await fetch_repos(ctx, is_archived=True)
 
 
 @mcp.tool(
     title="List Forked GitHub Repositories",
     description="Fetches a list of forked repositories owned by the authenticated GitHub user. "
-    "This tool returns a list of `RepoData` objects representing the archived repositories.",
+    "This tool returns a list of `RepoData` objects representing the forked repositories.",
 )
 async def get_forked_repos(ctx: Context[ServerSession, None]) -> List[RepoData]:
     """Fetches an array of forked repositories from GitHub.
@@ -114,7 +342,8 @@ async def get_forked_repos(ctx: Context[ServerSession, None]) -> List[RepoData]:
     Example:
         repos = await get_forked_repos(ctx)
     """
-    return [repo for repo in await get_repos(ctx) if repo.fork]
+    await log_info(ctx, "Info: Starting processing")
+    return await fetch_repos(ctx, is_fork=True)
 
 
 # Temporarily disabling DELETE until further testing and/or need
@@ -141,10 +370,61 @@ async def get_forked_repos(ctx: Context[ServerSession, None]) -> List[RepoData]:
 #         delete_repo("johndoe", "my-project", ctx)
 #     """
 #     await ctx.info("Info: Starting deleting processing")
-#     response = make_github_request(url=f"repos/{owner}/{name}", method="DELETE")
+#     response = await make_github_request(url=f"repos/{owner}/{name}", method="DELETE")
 #     return response.status_code
 
 
+async def patch_repo(
+    owner: str, name: str, content: bytes, ctx: Context[ServerSession, None]
+) -> int:
+    """Sends an already encoded update for a repository to GitHub.
+
+    Args:
+        owner (str): The GitHub username or organization name that owns the repository
+        name (str): The name of the repository to update
+        content (bytes): JSON encoded attributes to be updated
+        ctx (Context[ServerSession, None]): Context for the MCP server session
+
+    Returns:
+        int: The HTTP status code of the update request
+    """
+    await log_info(ctx, "Info: Updating %s/%s repo", owner, name)
+    response = await make_github_request(
+        url=f"repos/{owner}/{name}",
+        method="PATCH",
+        content=content,
+        headers=JSON_CONTENT_HEADERS,
+    )
+    invalidate_repos()
+    return response.status_code
+
+
+async def patch_repos(
+    repos: List[RepoRef], content: bytes, ctx: Context[ServerSession, None]
+) -> List[int]:
+    """Sends the same encoded update for many repositories to GitHub concurrently.
+
+    Args:
+        repos (List[RepoRef]): The repositories to update
+        content (bytes): JSON encoded attributes to be updated
+        ctx (Context[ServerSession, None]): Context for the MCP server session
+
+    Returns:
+        List[int]: The HTTP status code of each update request, in order of repos
+    """
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def patch_one(repo: RepoRef) -> int:
+        async with semaphore:
+            try:
+                return await patch_repo(repo.owner, repo.name, content, ctx)
+            except httpx.HTTPStatusError as error:
+                # Report the failure for this repository without failing the rest
+                return error.response.status_code
+
+    return await asyncio.gather(*(patch_one(repo) for repo in repos))
+
+
 @mcp.tool(
     title="Update Repository",
     description="Updates an attribute of a GitHub repository. This tool allows you to modify "
@@ -169,11 +449,7 @@ async def update_repo(
     Example:
         status_code = await update_repo("johndoe", "my-project", {"visibility": "private"}, ctx)
     """
-    await ctx.info(f"Info: Updating {owner}/{name} repo")
-    response = make_github_request(
-        url=f"repos/{owner}/{name}", method="PATCH", data=json.dumps(payload)
-    )
-    return response.status_code
+    return await patch_repo(owner, name, orjson.dumps(payload), ctx)
 
 
 @mcp.tool(
@@ -198,9 +474,8 @@ async def make_repo_private(
     Example:
         status_code = await make_repo_private("johndoe", "my-project", ctx)
     """
-    await ctx.info(f"Info: Updating {name} to be private")
-    data = {"visibility": "private"}
-    return await update_repo(owner, name, data, ctx)
+    await log_info(ctx, "Info: Updating %s to be private", name)
+    return await patch_repo(owner, name, PRIVATE_PAYLOAD, ctx)
 
 
 @mcp.tool(
@@ -224,14 +499,13 @@ async def unarchive_repo(
     Example:
         status_code = await unarchive_repo("johndoe", "my-project", ctx)
     """
-    await ctx.info(f"Info: Unarchiving {name}")
-    data = {"archived": False}
-    return await update_repo(owner, name, data, ctx)
+    await log_info(ctx, "Info: Unarchiving %s", name)
+    return await patch_repo(owner, name, UNARCHIVE_PAYLOAD, ctx)
 
 
 @mcp.tool(
     title="Archive GitHub Repository",
-    description="Unarchives a GitHub repository. This tool utilizes the 'Update Repository' "
+    description="Archives a GitHub repository. This tool utilizes the 'Update Repository' "
     "tool to modify the repository's archive status making it read-only.",
 )
 async def archive_repo(owner: str, name: str, ctx: Context[ServerSession, None]) -> int:
@@ -248,9 +522,80 @@ async def archive_repo(owner: str, name: str, ctx: Context[ServerSession, None])
     Example:
         status_code = await archive_repo("johndoe", "my-project", ctx)
     """
-    await ctx.info(f"Info: Unarchiving {name}")
-    data = {"archived": True}
-    return await update_repo(owner, name, data, ctx)
+    await log_info(ctx, "Info: Archiving %s", name)
+    return await patch_repo(owner, name, ARCHIVE_PAYLOAD, ctx)
+
+
+@mcp.tool(
+    title="Make Repositories Private",
+    description="Sets the visibility of many GitHub repositories to private at once. "
+    "Returns the HTTP status code of each update, in the order given.",
+)
+async def make_repos_private(
+    repos: List[RepoRef], ctx: Context[ServerSession, None]
+) -> List[int]:
+    """This tool updates the visibility setting of many repositories to private.
+
+    Args:
+        repos (List[RepoRef]): The repositories to make private
+        ctx (Context[ServerSession, None]): Context for the MCP server session
+
+    Returns:
+        List[int]: The HTTP status code of each update request
+
+    Example:
+        status_codes = await make_repos_private([RepoRef(owner="johndoe", name="my-project")], ctx)
+    """
+    await log_info(ctx, "Info: Updating %s repos to be private", len(repos))
+    return await patch_repos(repos, PRIVATE_PAYLOAD, ctx)
+
+
+@mcp.tool(
+    title="Unarchive GitHub Repositories",
+    description="Unarchives many GitHub repositories at once. "
+    "Returns the HTTP status code of each update, in the order given.",
+)
+async def unarchive_repos(
+    repos: List[RepoRef], ctx: Context[ServerSession, None]
+) -> List[int]:
+    """This tool unarchives many repositories that were previously archived.
+
+    Args:
+        repos (List[RepoRef]): The repositories to unarchive
+        ctx (Context[ServerSession, None]): Context for the MCP server session
+
+    Returns:
+        List[int]: The HTTP status code of each update request
+
+    Example:
+        status_codes = await unarchive_repos([RepoRef(owner="johndoe", name="my-project")], ctx)
+    """
+    await log_info(ctx, "Info: Unarchiving %s repos", len(repos))
+    return await patch_repos(repos, UNARCHIVE_PAYLOAD, ctx)
+
+
+@mcp.tool(
+    title="Archive GitHub Repositories",
+    description="Archives many GitHub repositories at once, making them read-only. "
+    "Returns the HTTP status code of each update, in the order given.",
+)
+async def archive_repos(
+    repos: List[RepoRef], ctx: Context[ServerSession, None]
+) -> List[int]:
+    """This tool archives many repositories, making them read-only.
+
+    Args:
+        repos (List[RepoRef]): The repositories to archive
+        ctx (Context[ServerSession, None]): Context for the MCP server session
+
+    Returns:
+        List[int]: The HTTP status code of each update request
+
+    Example:
+        status_codes = await archive_repos([RepoRef(owner="johndoe", name="my-project")], ctx)
+    """
+    await log_info(ctx, "Info: Archiving %s repos", len(repos))
+    return await patch_repos(repos, ARCHIVE_PAYLOAD, ctx)
 
 
 @mcp.prompt(title="Code Review")
@@ -259,4 +604,10 @@ def review_code(code: str) -> str:
 
 
 if __name__ == "__main__":
-    mcp.run()
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+    else:
+        # uvloop schedules the many concurrent GitHub requests faster than asyncio
+        anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
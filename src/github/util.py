@@ -1,7 +1,12 @@
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from os import getenv
-from typing import Literal
+from time import time
+from typing import AsyncIterator, Literal
 
-import requests
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 
@@ -9,8 +14,32 @@ from dotenv import load_dotenv
 load_dotenv()
 
 GITHUB_API_BASE_URL = "https://api.github.com/"
+GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "mcp-server",
+}
+# Headers for requests sending an (orjson encoded) JSON body
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
 
+# Responses worth retrying with backoff as they are usually transient, connection
+# errors are retried the same way
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
 
+# Requests kept in reserve before waiting for the rate limit to reset
+RATE_LIMIT_RESERVE = 5
+# Longest wait for a rate limit to reset, beyond that GitHub's error is returned
+MAX_RATE_LIMIT_WAIT = 60.0
+
+# Last known (remaining, reset timestamp) per rate limit resource, e.g. "core"
+_rate_limits: dict[str, tuple[int, float]] = {}
+
+# Shared client, opened and closed by the server lifespan (see github_client)
+_client: httpx.AsyncClient | None = None
+
+
+@lru_cache(maxsize=1)
 def get_github_token() -> str:
     """Get GitHub token from environment variable.
 
@@ -28,26 +57,142 @@ def get_github_token() -> str:
     return token
 
 
-def make_github_request(
-    url: str, method: Literal["GET", "DELETE", "PATCH"] = "GET", **kwargs
-) -> requests.Response:
+@lru_cache(maxsize=1)
+def get_auth_headers() -> dict[str, str]:
+    """Get the authorization headers for the GitHub API, built once.
+
+    Returns:
+        dict[str, str]: Headers carrying the GitHub API token
+
+    Raises:
+        ValueError: If GITHUB_TOKEN environment variable is not set or empty
+    """
+    return {"Authorization": f"token {get_github_token()}"}
+
+
+@asynccontextmanager
+async def github_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Open the shared GitHub API client and close it on exit.
+
+    Yields:
+        httpx.AsyncClient: The client used by make_github_request
+    """
+    global _client
+    _client = httpx.AsyncClient(
+        base_url=GITHUB_API_BASE_URL,
+        headers=GITHUB_API_HEADERS,
+        timeout=30.0,
+        http2=True,
+        # Every request multiplexes over one HTTP/2 connection to GitHub
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+    )
+    try:
+        yield _client
+    finally:
+        await _client.aclose()
+        _client = None
+
+
+async def make_github_request(
+    url: str, method: Literal["GET", "DELETE", "PATCH", "POST"] = "GET", **kwargs
+) -> httpx.Response:
     """Make a GitHub API request with proper headers.
 
     Args:
         url (str): The GitHub API endpoint URL
-        method (Literal["GET", "DELETE", "PATCH"]): HTTP method to use
-        **kwargs: Additional arguments to pass to requests.request
+        method (Literal["GET", "DELETE", "PATCH", "POST"]): HTTP method to use
+        **kwargs: Additional arguments to pass to httpx.AsyncClient.request
 
     Returns:
-        requests.Response: The HTTP response from GitHub API
+        httpx.Response: The HTTP response from GitHub API
 
     Raises:
-        requests.RequestException: If the request fails
+        RuntimeError: If the shared client has not been opened
+        httpx.HTTPError: If the request fails
     """
-    headers = {"Authorization": f"token {get_github_token()}"}
-    if "headers" in kwargs:
-        headers.update(kwargs["headers"])
-    kwargs["headers"] = headers
-    response = requests.request(method, GITHUB_API_BASE_URL + url, **kwargs)
+    if _client is None:
+        raise RuntimeError("GitHub client is not open, use github_client()")
+    if "Authorization" not in _client.headers:
+        # Set lazily so a missing token fails the call instead of server startup
+        _client.headers.update(get_auth_headers())
+    resource = "graphql" if url == "graphql" else "core"
+    retried_after = False
+    for attempt in range(MAX_RETRIES + 1):
+        await wait_for_rate_limit(resource)
+        try:
+            response = await _client.request(method, url, **kwargs)
+        except httpx.ConnectError:
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(BACKOFF_FACTOR * 2**attempt)
+            continue
+        update_rate_limit(response)
+        retry_after = response.headers.get("Retry-After")
+        if response.status_code in (403, 429) and retry_after:
+            # GitHub says when to try again, honour it once unless that is too far off
+            if retried_after or int(retry_after) > MAX_RATE_LIMIT_WAIT:
+                break
+            retried_after = True
+            await asyncio.sleep(int(retry_after))
+            continue
+        if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+            break
+        await asyncio.sleep(BACKOFF_FACTOR * 2**attempt)
     response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
     return response
+
+
+def update_rate_limit(response: httpx.Response) -> None:
+    """Record the rate limit budget GitHub reported with a response.
+
+    Args:
+        response (httpx.Response): Any response from the GitHub API
+    """
+    headers = response.headers
+    if "X-RateLimit-Remaining" not in headers:
+        return
+    _rate_limits[headers.get("X-RateLimit-Resource", "core")] = (
+        int(headers["X-RateLimit-Remaining"]),
+        float(headers.get("X-RateLimit-Reset", 0)),
+    )
+
+
+async def wait_for_rate_limit(resource: str) -> None:
+    """Wait for the rate limit to reset when its budget is nearly spent.
+
+    Concurrent requests all see the same budget, so they throttle together
+    instead of each running into GitHub's rate limit errors.
+
+    Args:
+        resource (str): The rate limit resource the request counts against
+    """
+    remaining, reset = _rate_limits.get(resource, (RATE_LIMIT_RESERVE, 0.0))
+    wait = reset - time()
+    if remaining < RATE_LIMIT_RESERVE and 0 < wait <= MAX_RATE_LIMIT_WAIT:
+        await asyncio.sleep(wait)
+
+
+async def graphql_request(query: str, variables: dict | None = None) -> dict:
+    """Make a GitHub GraphQL API request.
+
+    Args:
+        query (str): The GraphQL query
+        variables (dict | None): Variables for the query
+
+    Returns:
+        dict: The "data" member of the GraphQL response
+
+    Raises:
+        RuntimeError: If GitHub reports errors for the query
+        httpx.HTTPError: If the request fails
+    """
+    response = await make_github_request(
+        "graphql",
+        method="POST",
+        content=orjson.dumps({"query": query, "variables": variables or {}}),
+        headers=JSON_CONTENT_HEADERS,
+    )
+    body = orjson.loads(response.content)
+    if body.get("errors"):
+        raise RuntimeError(f"GitHub GraphQL request failed: {body['errors']}")
+    return body["data"]
@@ -1,10 +1,27 @@
 import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 from mcp.server.fastmcp import FastMCP
-import pytz
 
 mcp = FastMCP(name="Time Tools")
 
+# e.g. "Thursday, October 15, 2026, at 05:33 AM CDT"
+DATETIME_FORMAT = "%A, %B %d, %Y, at %I:%M %p %Z"
+
+
+@lru_cache(maxsize=64)
+def get_zone(time_zone: str) -> ZoneInfo:
+    """Looks up a time zone once and reuses it on later calls.
+
+    Args:
+        time_zone: IANA time zone name, e.g. America/Chicago
+
+    Returns:
+      The ZoneInfo for the time zone
+    """
+    return ZoneInfo(time_zone)
+
 
 @mcp.tool(
     title="List Current Time",
@@ -20,11 +37,10 @@ async def get_time(time_zone: str = "America/Chicago") -> str:
       A string representing the date and time in the format:
       "Weekday, Month Day, Year, at Hour:Minute AM/PM CDT"
     """
-    cdt_timezone = pytz.timezone(time_zone)
-    now_cdt = datetime.datetime.now(cdt_timezone)
+    now_cdt = datetime.datetime.now(get_zone(time_zone))
 
     # Format the output string
-    formatted_datetime = now_cdt.strftime("%A, %B %d, %Y, at %I:%M %p %Z")
+    formatted_datetime = now_cdt.strftime(DATETIME_FORMAT)
 
     return formatted_datetime
 
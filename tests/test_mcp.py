@@ -2,10 +2,10 @@
 Integration test for MCP server using requests
 """
 
-from time import sleep
+from time import monotonic, sleep
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
-import pytz
 import pytest
 import requests
 
@@ -13,19 +13,33 @@ import requests
 BASE_URL = "http://localhost:8001"
 
 
+@pytest.fixture(scope="session")
+def http():
+    """Session shared by all tests, so they reuse its pooled connections"""
+    with requests.Session() as session:
+        yield session
+
+
 @pytest.fixture(scope="session", autouse=True)
-def wait_for_server(wait: int = 2):
-    """Temporarily using sleep method until more advanced method is implemented"""
-    sleep(wait)
+def wait_for_server(http, timeout: float = 15):
+    """Polls the docs endpoint until the server answers, instead of a fixed sleep"""
+    deadline = monotonic() + timeout
+    while monotonic() < deadline:
+        try:
+            http.get(f"{BASE_URL}/docs", timeout=0.5)
+            return
+        except (requests.ConnectionError, requests.Timeout):
+            sleep(0.05)
+    pytest.fail(f"Server at {BASE_URL} did not start within {timeout} seconds")
 
 
 class TestMCP:
 
-    def test_mcp_server_running(self):
+    def test_mcp_server_running(self, http):
         """
         Test that the MCP server is running by making a GET request to the docs endpoint.
         """
-        response = requests.get(f"{BASE_URL}/docs")
+        response = http.get(f"{BASE_URL}/docs")
         # Assert that the response status code is 200 (OK)
         assert (
             response.status_code == 200
@@ -34,16 +48,29 @@ class TestMCP:
 
 class TestGitHubMCP:
 
-    def test_github_docs_available(self):
+    def test_github_docs_available(self, http):
         """Checks that tool is available"""
-        response = requests.get(f"{BASE_URL}/github/docs")
+        response = http.get(f"{BASE_URL}/github/docs")
         assert (
             response.status_code == 200
         ), f"Expected status code 200, but got {response.status_code}"
 
-    def test_get_repos_method(self):
+    @pytest.mark.parametrize(
+        "tool", ["archive_repos", "unarchive_repos", "make_repos_private"]
+    )
+    def test_bulk_tools_available(self, http, tool):
+        """Checks that bulk tool is listed without calling it, as it changes repos"""
+        response = http.get(f"{BASE_URL}/github/openapi.json")
+        assert (
+            response.status_code == 200
+        ), f"Expected status code 200, but got {response.status_code}"
+        assert (
+            f"/{tool}" in response.json()["paths"]
+        ), f"Expected /{tool} in paths, received: {list(response.json()['paths'])}"
+
+    def test_get_repos_method(self, http):
         """Checks that tool is available"""
-        response = requests.post(f"{BASE_URL}/github/get_repos")
+        response = http.post(f"{BASE_URL}/github/get_repos")
         assert (
             response.status_code == 200
         ), f"Expected status code 200, but got {response.status_code}"
@@ -59,11 +86,11 @@ class TestTimeMCP:
         [{"time_zone": "America/Chicago"}, {}],
         ids=["timezone", "no timezone"],
     )
-    def test_get_time_method(self, payload):
+    def test_get_time_method(self, http, payload):
         """Checks that tool is available"""
-        response = requests.post(f"{BASE_URL}/time/get_time", json=payload)
+        response = http.post(f"{BASE_URL}/time/get_time", json=payload)
         # Define the Central Time Zone
-        central_timezone = pytz.timezone("America/Chicago")
+        central_timezone = ZoneInfo("America/Chicago")
         # Create date with Central Time Zone
         now_cdt = datetime.now(central_timezone)
         # Format the date
@@ -0,0 +1,124 @@
+"""
+Unit tests for the GitHub request retry and rate limit handling, using a mock transport
+"""
+
+from time import time
+import asyncio
+
+import httpx
+import pytest
+
+import util
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records the delays util sleeps for, without actually sleeping"""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(util.asyncio, "sleep", sleep)
+    monkeypatch.setattr(util, "_rate_limits", {})
+    return delays
+
+
+def send(responses, url="user"):
+    """Makes a GitHub request answered by responses in turn, the last one repeating.
+
+    Returns:
+        tuple[int, int]: The final status code and the number of requests sent
+    """
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses[min(len(requests), len(responses)) - 1]
+
+    async def run():
+        util._client = httpx.AsyncClient(
+            base_url=util.GITHUB_API_BASE_URL,
+            headers={"Authorization": "token test"},
+            transport=httpx.MockTransport(handler),
+        )
+        try:
+            return (await util.make_github_request(url)).status_code
+        except httpx.HTTPStatusError as error:
+            return error.response.status_code
+        finally:
+            await util._client.aclose()
+            util._client = None
+
+    return asyncio.run(run()), len(requests)
+
+
+def test_retry_after_is_honoured_once(sleeps):
+    """A 429 with Retry-After is retried once, after the delay GitHub asked for"""
+    response = httpx.Response(429, headers={"Retry-After": "30"})
+    assert send([response]) == (429, 2)
+    assert sleeps == [30]
+
+
+def test_retry_after_then_success(sleeps):
+    """The retry after Retry-After returns its successful response"""
+    responses = [httpx.Response(403, headers={"Retry-After": "1"}), httpx.Response(200)]
+    assert send(responses) == (200, 2)
+    assert sleeps == [1]
+
+
+def test_long_retry_after_is_not_waited_for(sleeps):
+    """A Retry-After beyond MAX_RATE_LIMIT_WAIT returns GitHub's error right away"""
+    response = httpx.Response(403, headers={"Retry-After": "3600"})
+    assert send([response]) == (403, 1)
+    assert sleeps == []
+
+
+def test_transient_errors_back_off(sleeps):
+    """Transient errors are retried with exponential backoff"""
+    responses = [httpx.Response(502), httpx.Response(503), httpx.Response(200)]
+    assert send(responses) == (200, 3)
+    assert sleeps == [0.5, 1.0]
+
+
+def test_transient_errors_give_up(sleeps):
+    """Transient errors stop being retried after MAX_RETRIES"""
+    assert send([httpx.Response(504)]) == (504, util.MAX_RETRIES + 1)
+    assert sleeps == [0.5, 1.0, 2.0]
+
+
+def test_other_errors_are_not_retried(sleeps):
+    """Errors that will not go away, like 404, are returned immediately"""
+    assert send([httpx.Response(404)]) == (404, 1)
+    assert sleeps == []
+
+
+def test_waits_when_rate_limit_nearly_spent(sleeps):
+    """Requests wait for the reset once the remaining budget drops below the reserve"""
+    reset = time() + 10
+    response = httpx.Response(
+        200,
+        headers={
+            "X-RateLimit-Remaining": "1",
+            "X-RateLimit-Reset": str(reset),
+            "X-RateLimit-Resource": "core",
+        },
+    )
+    assert send([response]) == (200, 1)
+    assert util._rate_limits["core"] == (1, reset)
+    send([httpx.Response(200)])
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 10
+
+
+def test_rate_limit_is_tracked_per_resource(sleeps):
+    """A spent GraphQL budget does not hold back REST requests"""
+    util._rate_limits["graphql"] = (0, time() + 10)
+    assert send([httpx.Response(200)]) == (200, 1)
+    assert sleeps == []
+
+
+def test_distant_rate_limit_reset_is_not_waited_for(sleeps):
+    """A reset beyond MAX_RATE_LIMIT_WAIT is not waited for"""
+    util._rate_limits["core"] = (0, time() + 3600)
+    assert send([httpx.Response(200)]) == (200, 1)
+    assert sleeps == []